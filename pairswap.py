@@ -1,19 +1,55 @@
 import os
+import asyncio
 import json
 import logging
+import pickle
+import tempfile
+import threading
 import time
 
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache, partial
 
 from typing import (
+    Any,
     Callable,
     Dict,
     List,
     Optional,
     Tuple,
+    Type,
+    Union,
 )
+from weakref import WeakValueDictionary
 
-from web3 import Web3
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+)
+import coincurve  # noqa: F401
+from eth_account import Account
+from eth_keys import keys
+from eth_keys.backends import (
+    CoinCurveECCBackend,
+    get_backend,
+)
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import websockets
+from web3 import (
+    HTTPProvider,
+    IPCProvider,
+    Web3,
+    WebsocketProvider,
+)
+from web3._utils.request import DEFAULT_TIMEOUT
+from web3.contract import Contract
+from web3.exceptions import (
+    TimeExhausted,
+    TransactionNotFound,
+)
 from web3.gas_strategies.time_based import (
     fast_gas_price_strategy,
     medium_gas_price_strategy,
@@ -21,6 +57,9 @@ from web3.gas_strategies.time_based import (
     glacial_gas_price_strategy,
 )
 from web3.types import (
+    HexStr,
+    RPCEndpoint,
+    RPCResponse,
     TxReceipt,
     TxParams,
 )
@@ -32,20 +71,139 @@ TokWei = int
 Token = float
 TxHash = str
 
+_WEI_PER_ETH: int = 10**18
+_BPS: int = 10_000  # Basis points in a unit
+
 log = logging.getLogger('pairswap')
 
+# NOTE: eth-keys signs with libsecp256k1 through coincurve, unless another backend is
+# forced with ECC_BACKEND_CLASS. Pure Python ECDSA is orders of magnitude slower.
+if not isinstance(get_backend(), CoinCurveECCBackend):
+    raise ImportError(
+        f"eth-keys backend is {type(get_backend()).__name__}, coincurve is required"
+    )
+
+ASSETS_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+ABIS_PATH: str = os.path.join(ASSETS_PATH, 'abis.pkl')
+TOKEN_METADATA_PATH: str = os.path.join(ASSETS_PATH, 'token_metadata.json')
+
 
 class Utils:
     @staticmethod
+    @lru_cache(maxsize=None)
     def load_abi(file_name: str) -> str:
-        file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            'assets',
-            file_name
-        )
+        file_path = os.path.join(ASSETS_PATH, file_name)
+
+        baked_abis = Utils._load_baked_abis()
+        if (
+            file_name in baked_abis
+            and os.path.getmtime(ABIS_PATH) >= os.path.getmtime(file_path)
+        ):
+            return baked_abis[file_name]
+
         with open(file_path) as f:
             return json.load(f)['abi']
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_baked_abis() -> Dict[str, List]:
+        try:
+            with open(ABIS_PATH, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # NOTE: Missing, truncated or otherwise unreadable pickle falls back to JSON.
+            return {}
+
+    @staticmethod
+    def bake_abis() -> None:
+        """ Serialize bundled JSON ABIs into a single pickle, which is faster to load
+        than parsing JSON on every start. Run with `python -m pairswap`.
+        """
+        abis = {}
+        for file_name in sorted(os.listdir(ASSETS_PATH)):
+            file_path = os.path.join(ASSETS_PATH, file_name)
+            if not file_name.endswith('.json') or file_path == TOKEN_METADATA_PATH:
+                continue
+            with open(file_path) as f:
+                abis[file_name] = json.load(f)['abi']
+
+        Utils._write_file_atomic(
+            ABIS_PATH, pickle.dumps(abis, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def to_checksum_address(address: str) -> str:
+        """ Memoized `Web3.toChecksumAddress`, as checksum requires keccak hashing.
+        """
+        return Web3.toChecksumAddress(address)
+
+    @staticmethod
+    def encode_calldata(selector: bytes, types: List[str], args: List) -> HexStr:
+        return Web3.toHex(selector + encode_abi(types, args))
+
+    @staticmethod
+    def http_session(pool_size: int = 32) -> Session:
+        """ HTTP session with a keep-alive connection pool. Can be shared between
+        clients using the same HTTP provider.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=3, backoff_factor=0.1),
+        )
+        session = Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+
+    @staticmethod
+    def _write_file_atomic(path: str, data: bytes) -> None:
+        """ Write file through a temporary file in the same directory, so that readers
+        never see it truncated or partially written.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def load_token_metadata(chain_id: int, token: str) -> Optional[Dict]:
+        """ Load cached immutable token metadata persisted by `save_token_metadata`.
+        """
+        try:
+            with open(TOKEN_METADATA_PATH) as f:
+                return json.load(f).get(f'{chain_id}:{token}')
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def save_token_metadata(chain_id: int, token: str, metadata: Dict) -> None:
+        """ Persist immutable token metadata so that following instantiations skip
+        the on-chain lookups.
+        """
+        try:
+            with open(TOKEN_METADATA_PATH) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+        cache[f'{chain_id}:{token}'] = metadata
+        # NOTE: Concurrent writer truncating the file would make the other one read it
+        # as empty and drop every cached entry.
+        try:
+            Utils._write_file_atomic(
+                TOKEN_METADATA_PATH,
+                json.dumps(cache, indent=2, sort_keys=True).encode('utf-8'),
+            )
+        except OSError as e:
+            log.debug(f"Failed to persist token metadata: {e}")
+
 
 GAS_STRATEGY_MAP: Dict[str, Callable] = {
     'fast': fast_gas_price_strategy,  # 1 minute
@@ -54,40 +212,200 @@ GAS_STRATEGY_MAP: Dict[str, Callable] = {
     'glacial': glacial_gas_price_strategy,  # 24 hours
 }
 
+# Node errors signalling that locally tracked nonce is out of sync with the wallet.
+NONCE_ERRORS: Tuple[str, ...] = (
+    'nonce too low',
+    'nonce too high',
+    'replacement transaction underpriced',
+)
+
 MAX_APPROVAL_HEX: str = '0x' + 'f' * 64
 MAX_APPROVAL_INT: int = int(MAX_APPROVAL_HEX, 16)
 
-FACTORY_ADDRESS: str = '0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f'
+# Allowance can be reduced outside of this client, so cached value is refreshed daily.
+APPROVAL_CACHE_TTL: int = 24 * 60 * 60  # Seconds
+
+HEADS_RECONNECT_DELAY: int = 5  # Seconds
+
+# Estimated gas limit is raised by the margin in case chain state changes before mining.
+GAS_ESTIMATE_MARGIN: float = 1.15
+# Gas limit used when transaction can not be estimated, e.g. swap after pending approval.
+DEFAULT_GAS: int = 300_000
+
+# NOTE: Contract addresses are checksummed once at import.
+FACTORY_ADDRESS: str = Utils.to_checksum_address('0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f')
 FACTORY_ABI: str = Utils.load_abi('IUniswapV2Factory.json')
 
-ROUTER_ADDRESS: str = '0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D'
+ROUTER_ADDRESS: str = Utils.to_checksum_address('0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D')
 ROUTER_ABI: str = Utils.load_abi('IUniswapV2Router02.json')
 
 ERC20_ABI: str = Utils.load_abi('IUniswapV2ERC20.json')
 PAIR_ABI: str = Utils.load_abi('IUniswapV2Pair.json')
 
+MULTICALL2_ADDRESS: str = Utils.to_checksum_address(
+    '0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696'
+)
+MULTICALL2_ABI: str = Utils.load_abi('Multicall2.json')
+
+# Selectors and argument types of the submitted transactions, encoded without
+# contract function lookup on every call.
+APPROVE_SELECTOR: bytes = Web3.keccak(text='approve(address,uint256)')[:4]
+APPROVE_TYPES: List[str] = ['address', 'uint256']
+
+SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR: bytes = Web3.keccak(
+    text='swapExactETHForTokens(uint256,address[],address,uint256)'
+)[:4]
+SWAP_EXACT_ETH_FOR_TOKENS_TYPES: List[str] = ['uint256', 'address[]', 'address', 'uint256']
+
+SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR: bytes = Web3.keccak(
+    text='swapExactTokensForETH(uint256,uint256,address[],address,uint256)'
+)[:4]
+SWAP_EXACT_TOKENS_FOR_ETH_TYPES: List[str] = [
+    'uint256', 'uint256', 'address[]', 'address', 'uint256'
+]
+
+# (contract, function name, arguments, output types)
+Call = Tuple[Contract, str, List, List[str]]
+# (to address, calldata, transaction parameters)
+TxRequest = Tuple[str, HexStr, TxParams]
+
 
 class PairswapError(Exception):
     pass
 
 
-class PairswapClient:
+class PartialSubmitError(PairswapError):
+    """ Some of the transactions submitted together failed. `results` holds the
+    transaction hash or the exception for every transaction, and `nonces` the nonce
+    it was signed with, both in the submission order.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        results: List[Union[TxHash, Exception]],
+        nonces: List[int],
+    ) -> None:
+        super().__init__(message)
+        self.results = results
+        self.nonces = nonces
+
+
+class BatchingHTTPProvider(HTTPProvider):
+    """ HTTP provider able to send multiple requests as JSON-RPC batches.
+    """
+
+    # NOTE: Nodes handle large batches poorly, so requests are split into small ones.
+    MAX_BATCH: int = 10
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
+    ) -> None:
+        super().__init__(endpoint_uri, request_kwargs)
+        # NOTE: web3 caches HTTP sessions per thread, so a session passed to it is used
+        # only by the thread that created the provider. Requests sent from executor
+        # threads have to go through the provider's own session.
+        self._session = session or Utils.http_session()
+
+    def _post(self, data: bytes) -> bytes:
+        kwargs = self.get_request_kwargs()
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        response = self._session.post(self.endpoint_uri, data=data, **kwargs)
+        response.raise_for_status()
+        return response.content
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        raw_response = self._post(self.encode_rpc_request(method, params))
+        return self.decode_rpc_response(raw_response)
+
+    def make_batch_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> List[RPCResponse]:
+        responses: List[RPCResponse] = []
+        for i in range(0, len(requests), self.MAX_BATCH):
+            batch = [
+                {
+                    'jsonrpc': '2.0',
+                    'method': method,
+                    'params': params,
+                    'id': next(self.request_counter),
+                }
+                for method, params in requests[i:i + self.MAX_BATCH]
+            ]
+            raw_response = self._post(json.dumps(batch).encode('utf-8'))
+            response = json.loads(raw_response)
+            if not isinstance(response, list):
+                raise PairswapError(f"Batch request failed: {response}")
+
+            # NOTE: Batch responses are not guaranteed to be in the request order, and
+            # errors that can not be attributed to a request have null id.
+            responses_by_id = {r.get('id'): r for r in response}
+            for request in batch:
+                if request['id'] not in responses_by_id:
+                    error = responses_by_id.get(None, {}).get('error')
+                    raise PairswapError(
+                        f"Batch response is missing '{request['method']}' request "
+                        f"with id {request['id']}" + (f": {error}" if error else "")
+                    )
+                responses.append(responses_by_id[request['id']])
+
+        return responses
+
+
+class LockingWebsocketProvider(WebsocketProvider):
+    """ Websocket provider safe to use from multiple threads.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # NOTE: Requests share a single connection and responses are not matched to
+        # requests by id, so concurrent requests have to be serialized.
+        self._lock = threading.Lock()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        with self._lock:
+            return super().make_request(method, params)
+
+
+class PairswapSession:
+    """ Provider connection with the wallet, router and transaction nonce tracking,
+    shared between pair clients.
+
+    >>> with PairswapSession(address, private_key, provider) as session:
+    ...     pairs = [ETHPair(session, token) for token in tokens]
+    """
+
+    # NOTE: Contract factories are keyed by connection and ABI identity. Factory holds
+    # a reference to its connection, so the key can not be reused while it is alive.
+    _contract_factories: 'WeakValueDictionary[Tuple[int, int], Type[Contract]]' = (
+        WeakValueDictionary()
+    )
+
     def __init__(
         self,
         address: str,
         private_key: str,
         provider: str,
-        gas: int,
-        gas_price: Wei,
+        gas: Optional[int] = None,  # Estimated per transaction when not set
+        gas_price: Wei = Web3.toWei(100, 'gwei'),
+        http_session: Optional[Session] = None,  # Shared HTTP connection pool
     ) -> None:
-        self.address = Web3.toChecksumAddress(address)
-        self.private_key = private_key
+        self.address = Utils.to_checksum_address(address)
+        # Parsed signing key, so that the public key is not derived on every signature.
+        self._signing_key = keys.PrivateKey(Web3.toBytes(hexstr=private_key))
+        if self._signing_key.public_key.to_checksum_address() != self.address:
+            raise PairswapError(f"Private key does not belong to address '{self.address}'")
         self.provider = provider
 
         if self.provider.startswith('https://'):
-            web3_provider = Web3.HTTPProvider(self.provider, request_kwargs={"timeout": 60})
+            web3_provider = BatchingHTTPProvider(
+                self.provider,
+                request_kwargs={"timeout": 60},
+                session=http_session or Utils.http_session(),
+            )
         elif self.provider.startswith('wss://'):
-            web3_provider = Web3.WebsocketProvider(self.provider)
+            web3_provider = LockingWebsocketProvider(self.provider)
         elif self.provider.startswith('/'):
             web3_provider = Web3.IPCProvider(self.provider)
         else:
@@ -97,8 +415,69 @@ class PairswapClient:
         if not self.is_connected:
             raise PairswapError(f"Connection failed to provider '{self.provider}'")
 
+        self.chain_id = self.conn.eth.chainId
+        self.factory = self.contract_factory(self.conn, FACTORY_ABI)(
+            address=FACTORY_ADDRESS
+        )
+        self.router = self.contract_factory(self.conn, ROUTER_ABI)(
+            address=ROUTER_ADDRESS
+        )
+        self.multicall = self.contract_factory(self.conn, MULTICALL2_ABI)(
+            address=MULTICALL2_ADDRESS
+        )
+        self.has_multicall = len(self.conn.eth.getCode(MULTICALL2_ADDRESS)) > 0
+
         self.tx_gas = gas
         self.tx_gas_price = gas_price
+        # Transaction parameters that are the same for every transaction.
+        self._tx_template: TxParams = {'from': self.address, 'chainId': self.chain_id}
+
+        # NOTE: Nonce is tracked locally, as wallet transaction count reported by the
+        # node is lagging behind and costs a round trip on every transaction.
+        self._nonce_lock = threading.Lock()
+        self._next_nonce = self.conn.eth.getTransactionCount(self.address, 'pending')
+
+        # Latest block number, tracked only while subscribed to new heads.
+        self.head: Optional[int] = None
+        self._heads_thread: Optional[threading.Thread] = None
+        if self.provider.startswith('wss://'):
+            self._heads_loop = asyncio.new_event_loop()
+            self._heads_task = self._heads_loop.create_task(self._watch_heads())
+            self._heads_thread = threading.Thread(
+                target=self._run_heads_loop,
+                name=f'pairswap-heads-{hex(id(self))}',
+                daemon=True,
+            )
+            self._heads_thread.start()
+
+    def __enter__(self) -> 'PairswapSession':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Stop new heads subscription. Session keeps running its background
+        thread until closed.
+        """
+        if self._heads_thread is None:
+            return
+
+        self._heads_loop.call_soon_threadsafe(self._heads_task.cancel)
+        self._heads_thread.join()
+        self._heads_thread = None
+
+    @classmethod
+    def contract_factory(cls, conn: Web3, abi: List) -> Type[Contract]:
+        """ Contract factory for the ABI, shared between clients of the same connection
+        so that the ABI is only normalized once.
+        """
+        key = (id(conn), id(abi))
+        factory = cls._contract_factories.get(key)
+        if factory is None:
+            factory = conn.eth.contract(abi=abi)
+            cls._contract_factories[key] = factory
+        return factory
 
     @property
     def is_connected(self) -> bool:
@@ -120,151 +499,534 @@ class PairswapClient:
         self.conn.eth.setGasPriceStrategy(GAS_STRATEGY_MAP[mode])
         return self.conn.eth.generateGasPrice()
 
+    async def call_async(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """ Run blocking client call in the event loop default executor, so that
+        multiple network requests can be awaited concurrently. Requests over
+        a websocket provider share one connection and are sent one at a time.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    def _run_heads_loop(self) -> None:
+        try:
+            self._heads_loop.run_until_complete(self._heads_task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._heads_loop.close()
+
+    async def _watch_heads(self) -> None:
+        """ Track latest block number with `newHeads` subscription on a dedicated
+        websocket connection.
+        """
+        while True:
+            try:
+                async with websockets.connect(self.provider) as ws:
+                    await ws.send(json.dumps({
+                        'jsonrpc': '2.0',
+                        'id': 1,
+                        'method': 'eth_subscribe',
+                        'params': ['newHeads'],
+                    }))
+                    response = json.loads(await ws.recv())
+                    if 'error' in response:
+                        raise PairswapError(response['error'])
+
+                    async for message in ws:
+                        head = json.loads(message)['params']['result']
+                        self.head = int(head['number'], 16)
+            except Exception as e:
+                log.warning(
+                    f"New heads subscription failed, reconnecting in "
+                    f"{HEADS_RECONNECT_DELAY} seconds: {e}"
+                )
+            finally:
+                self.head = None
+
+            await asyncio.sleep(HEADS_RECONNECT_DELAY)
+
     def __repr__(self) -> str:
-        return f"<PairswapClient({self.provider})@{hex(id(self))}>"
+        return f"<PairswapSession({self.provider})@{hex(id(self))}>"
 
-    def _get_tx_params(
+    def get_tx_params(
         self,
         amount: Wei = 0,
         gas: Optional[int] = None,
         gas_price: Optional[Wei] = None,
         nonce: Optional[int] = None,
     ) -> TxParams:
-        return {
-            'from': self.address,
+        """ Transaction parameters. Gas is estimated and nonce is allocated on
+        submission when omitted.
+        """
+        params: TxParams = {
+            **self._tx_template,
             'value': amount,
-            'gas': gas if gas is not None else self.tx_gas,
             'gasPrice': gas_price if gas_price is not None else self.tx_gas_price,
-            'nonce': (
-                nonce
-                if nonce is not None
-                else self.conn.eth.getTransactionCount(self.address)
-            ),
         }
+        if gas is not None or self.tx_gas is not None:
+            params['gas'] = gas if gas is not None else self.tx_gas
+        if nonce is not None:
+            params['nonce'] = nonce
+        return params
+
+    def _estimate_gas(self, to: str, data: HexStr, params: Dict) -> int:
+        estimate = self.conn.eth.estimateGas({
+            'from': self.address,
+            'to': to,
+            'data': data,
+            'value': params['value'],
+        })
+        return int(estimate * GAS_ESTIMATE_MARGIN)
+
+    def _sync_nonce(self) -> None:
+        """ Reload next transaction nonce from the node.
+        """
+        with self._nonce_lock:
+            self._next_nonce = self.conn.eth.getTransactionCount(self.address, 'pending')
+
+    def _allocate_nonce(self) -> int:
+        with self._nonce_lock:
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def _call_each(self, calls: List[Call]) -> List[Tuple[bool, bytes]]:
+        """ Execute read-only contract calls as separate requests, batched when the
+        provider supports it. Used on chains without Multicall2.
+        """
+        requests: List[Tuple[RPCEndpoint, Any]] = []
+        for contract, fn_name, args, _ in calls:
+            # NOTE: Multicall2 ETH balance helper is served by the node directly.
+            if contract.address == MULTICALL2_ADDRESS and fn_name == 'getEthBalance':
+                requests.append((RPCEndpoint('eth_getBalance'), [args[0], 'latest']))
+                continue
+            requests.append((
+                RPCEndpoint('eth_call'),
+                [
+                    {
+                        'to': contract.address,
+                        'data': contract.encodeABI(fn_name=fn_name, args=args),
+                    },
+                    'latest',
+                ],
+            ))
+
+        provider = self.conn.provider
+        if isinstance(provider, BatchingHTTPProvider):
+            responses = provider.make_batch_request(requests)
+        else:
+            responses = [provider.make_request(*request) for request in requests]
+
+        results = []
+        for (method, _), response in zip(requests, responses):
+            if response.get('error') is not None or response.get('result') is None:
+                results.append((False, b''))
+            elif method == 'eth_getBalance':
+                results.append((True, int(response['result'], 16).to_bytes(32, 'big')))
+            else:
+                results.append((True, Web3.toBytes(hexstr=response['result'])))
+
+        return results
+
+    def aggregate(self, calls: List[Call]) -> List[Tuple]:
+        """ Execute read-only contract calls in a single `eth_call` using Multicall2,
+        falling back to batched requests on chains where it is not deployed.
+        """
+        if self.has_multicall:
+            results = self.multicall.functions.tryAggregate(
+                False,
+                [
+                    (contract.address, contract.encodeABI(fn_name=fn_name, args=args))
+                    for contract, fn_name, args, _ in calls
+                ]
+            ).call()
+        else:
+            results = self._call_each(calls)
+
+        if len(results) != len(calls):
+            raise PairswapError(f"Expected {len(calls)} call results, got {len(results)}")
+
+        decoded = []
+        for (contract, fn_name, args, types), (success, data) in zip(calls, results):
+            if not success:
+                raise PairswapError(
+                    f"Call '{fn_name}{tuple(args)}' to '{contract.address}' failed"
+                )
+            decoded.append(decode_abi(types, data))
+
+        return decoded
 
-    def _submit_tx(self, func: Callable, params: Dict) -> TxHash:
-        tx = func.buildTransaction(params)
-        tx_signed = self.conn.eth.account.sign_transaction(tx, private_key=self.private_key)
-        tx_hash = self.conn.eth.sendRawTransaction(tx_signed.rawTransaction)
+    def _sign_tx(self, to: str, data: HexStr, params: Dict) -> bytes:
+        # NOTE: Transaction is complete at this point and is signed locally, so the
+        # only request made is the raw transaction submission.
+        tx = {**params, 'to': to, 'data': data}
+        return Account.sign_transaction(tx, self._signing_key).rawTransaction
+
+    def _send_tx(self, to: str, data: HexStr, params: Dict) -> TxHash:
+        tx_hash = self.conn.eth.sendRawTransaction(self._sign_tx(to, data, params))
         return Web3.toHex(tx_hash)
 
+    def submit_tx(self, to: str, data: HexStr, params: Dict) -> TxHash:
+        """ Sign and send transaction, estimating gas and allocating the nonce when
+        they are not set.
+        """
+        if 'gas' not in params:
+            params = {**params, 'gas': self._estimate_gas(to, data, params)}
+
+        if 'nonce' in params:
+            tx_hash = self._send_tx(to, data, params)
+            with self._nonce_lock:
+                self._next_nonce = max(self._next_nonce, params['nonce'] + 1)
+            return tx_hash
+
+        for retry in (False, True):
+            try:
+                return self._send_tx(to, data, {**params, 'nonce': self._allocate_nonce()})
+            except Exception as e:
+                # NOTE: Allocated nonce is not used by the wallet if the transaction
+                # was not accepted, so the local counter has to be resynced.
+                self._sync_nonce()
+                if retry or not any(err in str(e) for err in NONCE_ERRORS):
+                    raise
+
+    async def _run_all(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """ Run blocking calls in the event loop default executor. Calls run
+        concurrently over HTTP and IPC providers and one by one otherwise, as
+        websocket requests share a single connection. Exceptions are returned in
+        place of results after all calls have finished.
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(self.conn.provider, (HTTPProvider, IPCProvider)):
+            return await asyncio.gather(
+                *(loop.run_in_executor(None, call) for call in calls),
+                return_exceptions=True,
+            )
+
+        def run_sequentially() -> List[Any]:
+            results: List[Any] = []
+            for call in calls:
+                try:
+                    results.append(call())
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        return await loop.run_in_executor(None, run_sequentially)
+
+    async def submit_all(self, txs: List[TxRequest]) -> List[TxHash]:
+        """ Sign transactions with consecutive nonces and send them concurrently.
+        Returns transaction hashes in the submission order, or raises
+        `PartialSubmitError` with per transaction results if any send failed.
+
+        >>> tx_hashes = await session.submit_all([
+        ...     pair_a.swap_tx(0.05),
+        ...     pair_b.swap_tx(0.05),
+        ... ])
+        """
+        estimates = await self._run_all([
+            partial(self._estimate_gas, to, data, params)
+            for to, data, params in txs
+            if 'gas' not in params
+        ])
+        for estimate in estimates:
+            if isinstance(estimate, Exception):
+                raise estimate
+        estimates_iter = iter(estimates)
+        txs = [
+            (to, data, params if 'gas' in params else {**params, 'gas': next(estimates_iter)})
+            for to, data, params in txs
+        ]
+
+        with self._nonce_lock:
+            next_nonce = self._next_nonce
+            self._next_nonce += sum('nonce' not in params for _, _, params in txs)
+            self._next_nonce = max(
+                [self._next_nonce]
+                + [params['nonce'] + 1 for _, _, params in txs if 'nonce' in params]
+            )
+
+        raw_txs, nonces = [], []
+        for to, data, params in txs:
+            if 'nonce' not in params:
+                params = {**params, 'nonce': next_nonce}
+                next_nonce += 1
+            raw_txs.append(self._sign_tx(to, data, params))
+            nonces.append(params['nonce'])
+
+        results = [
+            result if isinstance(result, Exception) else Web3.toHex(result)
+            for result in await self._run_all([
+                partial(self.conn.eth.sendRawTransaction, raw_tx) for raw_tx in raw_txs
+            ])
+        ]
+
+        # NOTE: Nonce is resynced only after every send has finished, as some of the
+        # transactions may have been accepted by the node.
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            self._sync_nonce()
+            outcomes = '; '.join(
+                f"#{i} nonce {nonce}: {result}"
+                for i, (nonce, result) in enumerate(zip(nonces, results))
+            )
+            raise PartialSubmitError(
+                f"{len(errors)} of {len(raw_txs)} transactions failed ({outcomes})",
+                results,
+                nonces,
+            ) from errors[0]
+
+        return results
+
+    def wait(
+        self,
+        hash: TxHash,
+        timeout: int = 3600,
+        poll_latency: float = 0.5,  # Seconds
+        max_poll_latency: float = 8.0,  # Seconds
+    ) -> TxReceipt:
+        """ Wait for transaction receipt. Polling interval is doubled after every
+        attempt to keep the node load low while waiting for long running transactions.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self.conn.eth.getTransactionReceipt(hash)
+            except TransactionNotFound:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeExhausted(
+                    f"Transaction {hash} is not in the chain after {timeout} seconds"
+                )
+
+            time.sleep(min(poll_latency, remaining))
+            poll_latency = min(poll_latency * 2, max_poll_latency)
+
+
+class PairswapClient:
+    def __init__(self, session: PairswapSession) -> None:
+        self.session = session
+
+    @property
+    def address(self) -> str:
+        return self.session.address
+
+    @property
+    def is_connected(self) -> bool:
+        return self.session.is_connected
+
+    def suggest_gas_price(self, mode: str = 'medium') -> Wei:
+        return self.session.suggest_gas_price(mode)
+
+    async def call_async(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        return await self.session.call_async(func, *args, **kwargs)
+
+    def wait(self, hash: TxHash, timeout: int = 3600) -> TxReceipt:
+        return self.session.wait(hash, timeout)
+
+    def __repr__(self) -> str:
+        return f"<PairswapClient({self.session.provider})@{hex(id(self))}>"
+
 
 class ETHPair(PairswapClient):
+    """ ETH/Token pair swap client.
+
+    Blocking calls can be awaited concurrently with `call_async` (requests are
+    only sent in parallel over HTTP and IPC providers):
+
+    >>> price, balance, token_balance = await asyncio.gather(
+    ...     pair.call_async(pair.get_price),
+    ...     pair.call_async(pair.get_balance),
+    ...     pair.call_async(pair.get_token_balance),
+    ... )
+    >>> tx_hash = await pair.call_async(pair.swap, 0.05)
+    >>> receipt = await pair.call_async(pair.wait, tx_hash)
+    """
+
     def __init__(
         self,
-        address: str,
-        private_key: str,
-        provider: str,
+        session: PairswapSession,
         token: str,  # Token address
         max_slippage: float = 0.2,  # Fraction
-        gas: int = Web3.toWei(100, 'gwei'),
-        gas_price: Wei = 250000,
         transaction_timeout: int = 300,  # Seconds
     ) -> None:
-        super().__init__(
-            address,
-            private_key,
-            provider,
-            gas,
-            gas_price,
-        )
+        super().__init__(session)
 
-        self.token = Web3.toChecksumAddress(token)
+        self.token = Utils.to_checksum_address(token)
         self.max_slippage = max_slippage
+        self._slippage_bps: int = round(max_slippage * _BPS)
         self.tx_timeout = transaction_timeout
 
-        self.contract = self.conn.eth.contract(
-            address=Web3.toChecksumAddress(FACTORY_ADDRESS),
-            abi=FACTORY_ABI
-        )
-        self.router = self.conn.eth.contract(
-            address=Web3.toChecksumAddress(ROUTER_ADDRESS),
-            abi=ROUTER_ABI
-        )
-        self.token_contract = self.conn.eth.contract(
-            address=Web3.toChecksumAddress(self.token),
-            abi=PAIR_ABI
+        self.token_contract = self._erc20_contract_factory(self.session.conn)(
+            address=self.token
         )
-        self.token_symbol = self.token_contract.functions.symbol().call()
-        self.token_decimals = self.token_contract.functions.decimals().call()
+
+        # NOTE: Token symbol, decimals and WETH address never change for a deployed
+        # contract, so they are resolved once and persisted between runs.
+        metadata = Utils.load_token_metadata(self.session.chain_id, self.token)
+        if metadata is None:
+            (symbol,), (decimals,), (weth_address,) = self.session.aggregate([
+                (self.token_contract, 'symbol', [], ['string']),
+                (self.token_contract, 'decimals', [], ['uint8']),
+                (self.session.router, 'WETH', [], ['address']),
+            ])
+            metadata = {
+                'symbol': symbol,
+                'decimals': decimals,
+                'weth_address': Utils.to_checksum_address(weth_address),
+            }
+            Utils.save_token_metadata(self.session.chain_id, self.token, metadata)
+
+        self.token_symbol: str = metadata['symbol']
+        self.token_decimals: int = metadata['decimals']
+        self._token_unit: int = 10**self.token_decimals
+        self.weth_address: str = metadata['weth_address']
+        self._path_eth_to_token: Tuple[str, str] = (self.weth_address, self.token)
+        self._path_token_to_eth: Tuple[str, str] = (self.token, self.weth_address)
+
+        # Router quotes valid for the block they were fetched at.
+        self._quotes: Dict[Tuple[str, int], int] = {}
+        self._quotes_head: Optional[int] = None
+
+        # Last known allowance and the time it was cached at, keyed by spender address.
+        self._approved_cache: Dict[str, Tuple[TokWei, float]] = {}
+
+    @classmethod
+    def _erc20_contract_factory(cls, conn: Web3) -> Type[Contract]:
+        return PairswapSession.contract_factory(conn, ERC20_ABI)
 
     @staticmethod
     def _eth_to_wei(amount: Ether) -> Wei:
-        return Wei(Web3.toWei(amount, 'ether'))
+        # NOTE: Float is converted through its decimal representation, as direct
+        # multiplication is not exact, e.g. 1.1 * 10**18 == 1100000000000000128.
+        return Wei(Decimal(str(amount)) * _WEI_PER_ETH)
 
     @staticmethod
     def _wei_to_eth(amount: Wei) -> Ether:
-        return Ether(Web3.fromWei(amount, 'ether'))
+        return Ether(amount / _WEI_PER_ETH)
 
     def _token_to_tokwei(self, amount: Token) -> TokWei:
-        return TokWei(amount * (10**self.token_decimals))
+        return TokWei(Decimal(str(amount)) * self._token_unit)
 
     def _tokwei_to_token(self, amount: TokWei) -> Token:
-        return Token(amount / (10**self.token_decimals))
-
-    @property
-    def weth_address(self) -> str:
-        return self.router.functions.WETH().call()
+        return Token(amount / self._token_unit)
 
-    @property
-    def balance(self) -> Ether:
+    def get_balance(self) -> Ether:
         """ Pair ETH balance.
         """
-        balance: Wei = self.conn.eth.getBalance(self.address)
+        balance: Wei = self.session.conn.eth.getBalance(self.address)
         return self._wei_to_eth(balance)
 
-    @property
-    def token_balance(self) -> Token:
+    def get_token_balance(self) -> Token:
         """ Pair token balance.
         """
         balance: TokWei = self.token_contract.functions.balanceOf(self.address).call()
         return self._tokwei_to_token(balance)
 
-    @property
-    def balances(self) -> Tuple[Ether, Token]:
+    def get_balances(self) -> Tuple[Ether, Token]:
         """ Current pair balance (ETH, Token)
         """
-        return (self.balance, self.token_balance)
+        (balance,), (token_balance,) = self.session.aggregate([
+            (self.session.multicall, 'getEthBalance', [self.address], ['uint256']),
+            (self.token_contract, 'balanceOf', [self.address], ['uint256']),
+        ])
+        return (self._wei_to_eth(balance), self._tokwei_to_token(token_balance))
 
     def __repr__(self) -> str:
         return f"<ETHPair({self.token_symbol})@{hex(id(self))}>"
 
     def __str__(self) -> str:
-        return json.dumps({'ETH': self.balance, self.token_symbol: self.token_balance})
+        balance, token_balance = self.get_balances()
+        return json.dumps({'ETH': balance, self.token_symbol: token_balance})
 
     def __bool__(self) -> bool:
-        return (
-            self.is_connected
-            and (
-                bool(self.balance)
-                or bool(self.token_balance)
-            )
-        )
+        return self.is_connected and any(self.get_balances())
 
-    @property
-    def _tx_deadline(self) -> int:
+    def _apply_slippage(self, amount: int) -> int:
+        """ Minimum amount accepted for the expected amount with max slippage applied.
+        Integer math avoids precision loss on large token amounts.
+        """
+        return amount * (_BPS - self._slippage_bps) // _BPS
+
+    def _get_tx_deadline(self) -> int:
         """ Generate a deadline timestamp for transaction.
         """
         return int(time.time()) + self.tx_timeout
 
+    def _cached_quotes(self) -> Optional[Dict[Tuple[str, int], int]]:
+        """ Quotes cache for the latest block. Quotes only change with the chain state,
+        so they are cached while subscribed to new heads.
+        """
+        head = self.session.head
+        if head is None:
+            return None
+        if head != self._quotes_head:
+            self._quotes = {}
+            self._quotes_head = head
+        return self._quotes
+
     def _tokwei_price_in_wei(self, amount: TokWei) -> Wei:
         """ Amount of tokens you can expect to get for supplied amount of Wei.
         """
-        return self.router.functions.getAmountsIn(
+        quotes = self._cached_quotes()
+        key = ('getAmountsIn', amount)
+        if quotes is not None and key in quotes:
+            return quotes[key]
+
+        price = self.session.router.functions.getAmountsIn(
             amount,
-            [self.weth_address, self.token]
+            self._path_eth_to_token
         ).call()[0]
+        if quotes is not None:
+            quotes[key] = price
+        return price
 
     def _wei_price_in_tokwei(self, amount: Wei) -> TokWei:
         """ Amount of Wei you can expect to get for supplied amount of tokens.
         """
-        return self.router.functions.getAmountsOut(
+        quotes = self._cached_quotes()
+        key = ('getAmountsOut', amount)
+        if quotes is not None and key in quotes:
+            return quotes[key]
+
+        price = self.session.router.functions.getAmountsOut(
             amount,
-            [self.weth_address, self.token]
+            self._path_eth_to_token
         ).call()[-1]
+        if quotes is not None:
+            quotes[key] = price
+        return price
 
-    @property
-    def price(self, amount: Ether = 1) -> Token:
+    def _quotes_pair(self, wei_amount: Wei, tokwei_amount: TokWei) -> Tuple[TokWei, Wei]:
+        """ Both `_wei_price_in_tokwei` and `_tokwei_price_in_wei` in a single call.
+        """
+        quotes = self._cached_quotes()
+        out_key = ('getAmountsOut', wei_amount)
+        in_key = ('getAmountsIn', tokwei_amount)
+        if quotes is not None and out_key in quotes and in_key in quotes:
+            return (quotes[out_key], quotes[in_key])
+
+        (amounts_out,), (amounts_in,) = self.session.aggregate([
+            (
+                self.session.router,
+                'getAmountsOut',
+                [wei_amount, self._path_eth_to_token],
+                ['uint256[]'],
+            ),
+            (
+                self.session.router,
+                'getAmountsIn',
+                [tokwei_amount, self._path_eth_to_token],
+                ['uint256[]'],
+            ),
+        ])
+        if quotes is not None:
+            quotes[out_key] = amounts_out[-1]
+            quotes[in_key] = amounts_in[0]
+        return (amounts_out[-1], amounts_in[0])
+
+    def get_price(self, amount: Ether = 1.0) -> Token:
         """ Price of ETH in Token.
         """
         return self._tokwei_to_token(
@@ -273,8 +1035,7 @@ class ETHPair(PairswapClient):
             )
         )
 
-    @property
-    def token_price(self, amount: Token = 1) -> Ether:
+    def get_token_price(self, amount: Token = 1.0) -> Ether:
         """ Price of Token in ETH.
         """
         return self._wei_to_eth(
@@ -283,31 +1044,46 @@ class ETHPair(PairswapClient):
             )
         )
 
+    def get_prices(self, amount: Ether = 1.0, token_amount: Token = 1.0) -> Tuple[Token, Ether]:
+        """ Current pair prices (ETH in Token, Token in ETH)
+        """
+        price, token_price = self._quotes_pair(
+            self._eth_to_wei(amount),
+            self._token_to_tokwei(token_amount),
+        )
+        return (self._tokwei_to_token(price), self._wei_to_eth(token_price))
+
     def is_token_approved(
         self,
         amount: TokWei = MAX_APPROVAL_INT,
     ) -> bool:
-        erc20_contract = self.conn.eth.contract(
-            address=self.token,
-            abi=PAIR_ABI
-        )
+        cached = self._approved_cache.get(self.session.router.address)
+        if (
+            cached is not None
+            and cached[0] >= amount
+            and time.monotonic() - cached[1] <= APPROVAL_CACHE_TTL
+        ):
+            return True
 
-        approved_amount = erc20_contract.functions.allowance(
-            self.address, self.router.address
+        approved_amount = self.token_contract.functions.allowance(
+            self.address, self.session.router.address
         ).call()
+        self._approved_cache[self.session.router.address] = (approved_amount, time.monotonic())
 
         return approved_amount >= amount
 
-    def wait(self, hash: TxHash, timeout: int = 3600) -> TxReceipt:
-        return self.conn.eth.waitForTransactionReceipt(hash, timeout=timeout)
-
     def approve_token(
         self,
         max_approval: TokWei = MAX_APPROVAL_INT,
         gas: Optional[int] = None,
         gas_price: Optional[Wei] = None,
         nonce: Optional[int] = None,
-    ) -> None:
+        wait: bool = True,
+    ) -> Optional[TxHash]:
+        """ Approve router to transfer tokens. Returns approval transaction hash or
+        None if the amount is already approved. With `wait=False` the transaction
+        is returned as soon as it is submitted.
+        """
         if self.is_token_approved(max_approval):
             log.debug(
                 (
@@ -315,7 +1091,7 @@ class ETHPair(PairswapClient):
                     f"{self.token_symbol} is already approved for transfer"
                 )
             )
-            return
+            return None
 
         log.info(
             (
@@ -323,42 +1099,31 @@ class ETHPair(PairswapClient):
                 f"of {self.token_symbol} for transfer"
             )
         )
-        log.debug(f"Approval gas: {gas or self.tx_gas}")
-        log.debug(f"Approval gas price: {gas_price or self.tx_gas_price} Wei")
+        log.debug(f"Approval gas: {gas or self.session.tx_gas or 'Estimated'}")
+        log.debug(f"Approval gas price: {gas_price or self.session.tx_gas_price} Wei")
         log.debug(f"Approval nonce: {nonce or 'Default'}")
 
-        erc20_contract = self.conn.eth.contract(
-            address=self.token,
-            abi=ERC20_ABI
+        data = Utils.encode_calldata(
+            APPROVE_SELECTOR,
+            APPROVE_TYPES,
+            [self.session.router.address, max_approval],
         )
-
-        func = erc20_contract.functions.approve(self.router.address, max_approval)
-        params = self._get_tx_params(
+        params = self.session.get_tx_params(
             gas=gas,
             gas_price=gas_price,
             nonce=nonce,
         )
 
-        # NOTE: Wallet nonce update is lagging behind and is not updated immediately after
-        # transaction receipt is received. This causes same nonce to be reused on the next
-        # transaction following approval.
-        current_nonce = (
-            nonce
-            if nonce is not None
-            else self.conn.eth.getTransactionCount(self.address)
-        )
-        tx_hash = self._submit_tx(func, params)
+        tx_hash = self.session.submit_tx(self.token, data, params)
+        if not wait:
+            log.debug(f"Approval transaction submitted: {tx_hash}")
+            return tx_hash
 
-        timeout = 3600  # 1 hour
-        timer_start = time.monotonic()
-        self.wait(tx_hash, timeout)
+        receipt = self.wait(tx_hash, 3600)
+        if receipt['status'] != 1:
+            raise PairswapError(f"Approval transaction {tx_hash} failed")
 
-        # NOTE: Wait for nonce to be incremented of for the timeout interval to run out.
-        while (
-            current_nonce == self.conn.eth.getTransactionCount(self.address)
-            and time.monotonic() - timer_start <= timeout
-        ):
-            time.sleep(0.5)
+        self._approved_cache[self.session.router.address] = (max_approval, time.monotonic())
 
         log.info(
             (
@@ -366,6 +1131,7 @@ class ETHPair(PairswapClient):
                 f"{self.token_symbol} was approved for transfer"
             )
         )
+        return tx_hash
 
     def swap(
         self,
@@ -376,42 +1142,60 @@ class ETHPair(PairswapClient):
     ) -> TxHash:
         """ Swap ETH to Token.
         """
-        swap_amount: Wei = self._eth_to_wei(amount)
-
-        amount_out_min: TokWei = TokWei(
-            (1 - self.max_slippage) * self._wei_price_in_tokwei(swap_amount)
-        )
-        path = [self.weth_address, self.token]
-        to_address = self.address
-        deadline = self._tx_deadline
-
+        tx, amount_out_min = self._build_swap(amount, gas, gas_price, nonce)
         log.info(
             (
                 f"Swapping {amount} ETH for a minimum of "
                 f"{self._tokwei_to_token(amount_out_min)} {self.token_symbol}"
             )
         )
+        return self.session.submit_tx(*tx)
+
+    def swap_tx(
+        self,
+        amount: Ether,
+        gas: Optional[int] = None,
+        gas_price: Optional[Wei] = None,
+        nonce: Optional[int] = None,
+    ) -> TxRequest:
+        """ Transaction swapping ETH to Token, to be submitted with the session.
+        """
+        return self._build_swap(amount, gas, gas_price, nonce)[0]
+
+    def _build_swap(
+        self,
+        amount: Ether,
+        gas: Optional[int],
+        gas_price: Optional[Wei],
+        nonce: Optional[int],
+    ) -> Tuple[TxRequest, TokWei]:
+        swap_amount: Wei = self._eth_to_wei(amount)
+
+        amount_out_min: TokWei = self._apply_slippage(self._wei_price_in_tokwei(swap_amount))
+        path = self._path_eth_to_token
+        to_address = self.address
+        deadline = self._get_tx_deadline()
+
         log.debug(f"Swap path: {path}")
         log.debug(f"Swap address: {to_address}")
         log.debug(f"Swap deadline: {datetime.fromtimestamp(deadline)}")
-        log.debug(f"Swap gas: {gas or self.tx_gas_price}")
-        log.debug(f"Swap gas price: {gas_price or self.tx_gas} Wei")
+        log.debug(f"Swap gas: {gas or self.session.tx_gas or 'Estimated'}")
+        log.debug(f"Swap gas price: {gas_price or self.session.tx_gas_price} Wei")
         log.debug(f"Swap nonce: {nonce or 'Default'}")
 
-        func = self.router.functions.swapExactETHForTokens(
-            amount_out_min,
-            path,
-            to_address,
-            deadline,
+        data = Utils.encode_calldata(
+            SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR,
+            SWAP_EXACT_ETH_FOR_TOKENS_TYPES,
+            [amount_out_min, path, to_address, deadline],
         )
-        params = self._get_tx_params(
+        params = self.session.get_tx_params(
             amount=swap_amount,
             gas=gas,
             gas_price=gas_price,
             nonce=nonce,
         )
 
-        return self._submit_tx(func, params)
+        return (self.session.router.address, data, params), amount_out_min
 
     def unswap(
         self,
@@ -424,44 +1208,87 @@ class ETHPair(PairswapClient):
         """
         unswap_amount: TokWei = self._token_to_tokwei(amount)
 
-        self.approve_token(
+        # NOTE: Approval is not awaited. Swap is submitted right after it with the
+        # following nonce, so it is mined in the same or a later block.
+        approval_tx_hash = self.approve_token(
             max_approval=unswap_amount,
             gas=gas,
             gas_price=gas_price,
             nonce=nonce,
+            wait=False,
         )
-
-        amount_out_min: Wei = Wei(
-            (1 - self.max_slippage) * self._tokwei_price_in_wei(unswap_amount)
-        )
-        path = [self.token, self.weth_address]
-        to_address = self.address
-        deadline = self._tx_deadline
-
+        if approval_tx_hash is not None:
+            if nonce is not None:
+                nonce += 1
+            # NOTE: Swap can not be estimated until the approval is mined.
+            if gas is None and self.session.tx_gas is None:
+                gas = DEFAULT_GAS
+
+        tx, amount_out_min = self._build_unswap(amount, gas, gas_price, nonce)
         log.info(
             (
                 f"Unswapping {amount} {self.token_symbol} for a minimum of "
                 f"{self._wei_to_eth(amount_out_min)} ETH"
             )
         )
+        tx_hash = self.session.submit_tx(*tx)
+
+        # NOTE: Router transfer consumes the allowance unless it is unlimited.
+        cached = self._approved_cache.get(self.session.router.address)
+        if cached is not None and cached[0] != MAX_APPROVAL_INT:
+            self._approved_cache[self.session.router.address] = (
+                max(cached[0] - unswap_amount, 0),
+                cached[1],
+            )
+
+        return tx_hash
+
+    def unswap_tx(
+        self,
+        amount: Token,
+        gas: Optional[int] = None,
+        gas_price: Optional[Wei] = None,
+        nonce: Optional[int] = None,
+    ) -> TxRequest:
+        """ Transaction swapping Token to ETH, to be submitted with the session.
+        Token transfer has to be approved with `approve_token` beforehand.
+        """
+        return self._build_unswap(amount, gas, gas_price, nonce)[0]
+
+    def _build_unswap(
+        self,
+        amount: Token,
+        gas: Optional[int],
+        gas_price: Optional[Wei],
+        nonce: Optional[int],
+    ) -> Tuple[TxRequest, Wei]:
+        unswap_amount: TokWei = self._token_to_tokwei(amount)
+
+        amount_out_min: Wei = self._apply_slippage(self._tokwei_price_in_wei(unswap_amount))
+        path = self._path_token_to_eth
+        to_address = self.address
+        deadline = self._get_tx_deadline()
+
         log.debug(f"Unswap path: {path}")
         log.debug(f"Unswap address: {to_address}")
         log.debug(f"Unswap deadline: {datetime.fromtimestamp(deadline)}")
-        log.debug(f"Unswap gas: {gas or self.tx_gas}")
-        log.debug(f"Unswap gas price: {gas_price or self.tx_gas_price} Wei")
+        log.debug(f"Unswap gas: {gas or self.session.tx_gas or 'Estimated'}")
+        log.debug(f"Unswap gas price: {gas_price or self.session.tx_gas_price} Wei")
         log.debug(f"Unswap nonce: {nonce or 'Default'}")
 
-        func = self.router.functions.swapExactTokensForETH(
-            unswap_amount,
-            amount_out_min,
-            path,
-            to_address,
-            deadline,
+        data = Utils.encode_calldata(
+            SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR,
+            SWAP_EXACT_TOKENS_FOR_ETH_TYPES,
+            [unswap_amount, amount_out_min, path, to_address, deadline],
         )
-        params = self._get_tx_params(
+        params = self.session.get_tx_params(
             gas=gas,
             gas_price=gas_price,
             nonce=nonce,
         )
 
-        return self._submit_tx(func, params)
+        return (self.session.router.address, data, params), amount_out_min
+
+
+if __name__ == '__main__':
+    Utils.bake_abis()
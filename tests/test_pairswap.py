@@ -0,0 +1,285 @@
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+import rlp
+from eth_account import Account
+from web3 import Web3
+
+import pairswap
+from pairswap import (
+    BatchingHTTPProvider,
+    ETHPair,
+    PairswapError,
+    PairswapSession,
+    PartialSubmitError,
+    Utils,
+)
+
+
+def test_eth_to_wei_is_exact():
+    assert ETHPair._eth_to_wei(1.1) == 1_100_000_000_000_000_000
+    assert ETHPair._eth_to_wei(0.05) == 50_000_000_000_000_000
+    assert ETHPair._eth_to_wei(1) == 10**18
+
+
+def test_wei_to_eth():
+    assert ETHPair._wei_to_eth(1_100_000_000_000_000_000) == 1.1
+
+
+def test_token_metadata_roundtrip(monkeypatch, tmp_path):
+    path = tmp_path / 'token_metadata.json'
+    monkeypatch.setattr(pairswap, 'TOKEN_METADATA_PATH', str(path))
+
+    Utils.save_token_metadata(1, '0xa', {'symbol': 'A'})
+    Utils.save_token_metadata(1, '0xb', {'symbol': 'B'})
+
+    assert Utils.load_token_metadata(1, '0xa') == {'symbol': 'A'}
+    assert Utils.load_token_metadata(1, '0xb') == {'symbol': 'B'}
+    assert [p.name for p in tmp_path.iterdir()] == ['token_metadata.json']
+
+
+@pytest.fixture
+def abis_path(monkeypatch, tmp_path):
+    path = tmp_path / 'abis.pkl'
+    monkeypatch.setattr(pairswap, 'ABIS_PATH', str(path))
+    Utils.load_abi.cache_clear()
+    Utils._load_baked_abis.cache_clear()
+    yield path
+    Utils.load_abi.cache_clear()
+    Utils._load_baked_abis.cache_clear()
+
+
+def test_load_abi_falls_back_to_json_on_truncated_pickle(abis_path):
+    abis_path.write_bytes(b'')
+
+    with open(os.path.join(pairswap.ASSETS_PATH, 'Multicall2.json')) as f:
+        assert Utils.load_abi('Multicall2.json') == json.load(f)['abi']
+
+
+def test_bake_abis_roundtrip(abis_path):
+    Utils.bake_abis()
+
+    assert Utils.load_abi('Multicall2.json') == pairswap.MULTICALL2_ABI
+    assert 'Multicall2.json' in Utils._load_baked_abis()
+    assert [p.name for p in abis_path.parent.iterdir()] == ['abis.pkl']
+
+
+class StubHTTPSession:
+    def __init__(self, respond):
+        self.respond = respond
+        self.threads = []
+
+    def post(self, endpoint_uri, data, **kwargs):
+        self.threads.append(threading.get_ident())
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.respond(json.loads(data))).encode('utf-8')
+        return response
+
+
+def _batch_provider(respond):
+    return BatchingHTTPProvider('http://localhost:8545', session=StubHTTPSession(respond))
+
+
+def test_http_provider_uses_given_session_from_other_threads():
+    provider = _batch_provider(
+        lambda request: {'jsonrpc': '2.0', 'id': request['id'], 'result': '0x1'},
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        response = executor.submit(provider.make_request, 'eth_chainId', []).result()
+
+    assert response['result'] == '0x1'
+    assert provider._session.threads and threading.get_ident() not in provider._session.threads
+
+
+def test_http_providers_on_same_uri_keep_own_sessions():
+    def respond(request):
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': '0x1'}
+
+    providers = [_batch_provider(respond), _batch_provider(respond)]
+    for provider in providers:
+        provider.make_request('eth_chainId', [])
+
+    assert [len(provider._session.threads) for provider in providers] == [1, 1]
+
+
+def test_batch_request_matches_out_of_order_responses():
+    provider = _batch_provider(
+        lambda batch: [
+            {'jsonrpc': '2.0', 'id': r['id'], 'result': r['params'][0]}
+            for r in reversed(batch)
+        ],
+    )
+
+    requests = [('eth_call', [i]) for i in range(BatchingHTTPProvider.MAX_BATCH + 3)]
+    responses = provider.make_batch_request(requests)
+
+    assert [r['result'] for r in responses] == list(range(len(requests)))
+
+
+def test_batch_request_raises_on_missing_response():
+    provider = _batch_provider(
+        lambda batch: [
+            {'jsonrpc': '2.0', 'id': r['id'], 'result': '0x'} for r in batch[1:]
+        ] + [
+            {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'Invalid'}},
+        ],
+    )
+
+    with pytest.raises(PairswapError, match='missing .eth_getBalance.*Invalid'):
+        provider.make_batch_request([('eth_getBalance', []), ('eth_call', [])])
+
+
+TEST_PRIVATE_KEY = '0x' + '11' * 32
+
+
+class StubProvider(BatchingHTTPProvider):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = []
+        self.errors = {}  # Error messages by send index
+        self.tx_count = 5
+
+    def make_request(self, method, params):
+        if method == 'eth_sendRawTransaction':
+            raw_tx = bytes.fromhex(params[0][2:])
+            self.sent.append(raw_tx)
+            error = self.errors.get(len(self.sent) - 1)
+            if error is not None:
+                return {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': error}}
+            result = Web3.toHex(Web3.keccak(raw_tx))
+        else:
+            result = {
+                'web3_clientVersion': 'stub',
+                'eth_chainId': '0x1',
+                'eth_getCode': '0x',
+                'eth_getTransactionCount': hex(self.tx_count),
+                'eth_estimateGas': '0x5208',
+            }[method]
+        return {'jsonrpc': '2.0', 'id': 1, 'result': result}
+
+
+def _stub_session(monkeypatch):
+    monkeypatch.setattr(pairswap, 'BatchingHTTPProvider', StubProvider)
+    address = Account.from_key(TEST_PRIVATE_KEY).address
+    return PairswapSession(address, TEST_PRIVATE_KEY, 'https://stub')
+
+
+def _nonce(raw_tx):
+    return int.from_bytes(rlp.decode(raw_tx)[0], 'big')
+
+
+def _stub_txs(session):
+    return [
+        (session.address, '0x', session.get_tx_params(amount=i, gas=21_000 if i % 2 else None))
+        for i in range(3)
+    ]
+
+
+def test_submit_tx_retries_once_with_resynced_nonce(monkeypatch):
+    session = _stub_session(monkeypatch)
+    provider = session.conn.provider
+    provider.tx_count = 7
+    provider.errors = {0: 'nonce too low'}
+
+    tx_hash = session.submit_tx(*_stub_txs(session)[1])
+
+    assert [_nonce(raw_tx) for raw_tx in provider.sent] == [5, 7]
+    assert tx_hash == Web3.toHex(Web3.keccak(provider.sent[1]))
+    assert session._next_nonce == 8
+
+
+def test_submit_tx_gives_up_after_second_nonce_error(monkeypatch):
+    session = _stub_session(monkeypatch)
+    provider = session.conn.provider
+    provider.errors = {0: 'nonce too low', 1: 'nonce too low'}
+
+    with pytest.raises(ValueError, match='nonce too low'):
+        session.submit_tx(*_stub_txs(session)[1])
+
+    assert len(provider.sent) == 2
+    assert session._next_nonce == 5
+
+
+def test_submit_tx_raises_other_errors_without_retry(monkeypatch):
+    session = _stub_session(monkeypatch)
+    provider = session.conn.provider
+    provider.errors = {0: 'insufficient funds for gas * price + value'}
+    session._next_nonce = 6
+
+    with pytest.raises(ValueError, match='insufficient funds'):
+        session.submit_tx(*_stub_txs(session)[1])
+
+    assert len(provider.sent) == 1
+    assert session._next_nonce == 5
+
+
+def test_submit_tx_explicit_nonce_advances_counter(monkeypatch):
+    session = _stub_session(monkeypatch)
+    to, data, params = _stub_txs(session)[1]
+
+    session.submit_tx(to, data, {**params, 'nonce': 9})
+    assert session._next_nonce == 10
+
+    session.submit_tx(to, data, {**params, 'nonce': 3})
+    assert session._next_nonce == 10
+    assert [_nonce(raw_tx) for raw_tx in session.conn.provider.sent] == [9, 3]
+
+
+def test_submit_all_assigns_consecutive_nonces(monkeypatch):
+    session = _stub_session(monkeypatch)
+
+    tx_hashes = asyncio.run(session.submit_all(_stub_txs(session)))
+
+    sent = session.conn.provider.sent
+    assert sorted(_nonce(raw_tx) for raw_tx in sent) == [5, 6, 7]
+    by_value = {int.from_bytes(rlp.decode(raw_tx)[4], 'big'): raw_tx for raw_tx in sent}
+    assert tx_hashes == [Web3.toHex(Web3.keccak(by_value[i])) for i in range(3)]
+    assert session._next_nonce == 8
+
+
+def test_submit_all_resyncs_nonce_after_failed_send(monkeypatch):
+    session = _stub_session(monkeypatch)
+    session.conn.provider.errors = {1: 'nope'}
+
+    with pytest.raises(PartialSubmitError, match='1 of 3 transactions failed') as exc_info:
+        asyncio.run(session.submit_all(_stub_txs(session)))
+
+    sent = session.conn.provider.sent
+    assert len(sent) == 3
+    assert session._next_nonce == 5
+
+    error = exc_info.value
+    assert error.nonces == [5, 6, 7]
+    by_nonce = {_nonce(raw_tx): raw_tx for raw_tx in sent}
+    failed_nonce = _nonce(sent[1])
+    for nonce, result in zip(error.nonces, error.results):
+        if nonce == failed_nonce:
+            assert isinstance(result, ValueError)
+        else:
+            assert result == Web3.toHex(Web3.keccak(by_nonce[nonce]))
+
+
+def test_sign_tx_matches_eth_account(monkeypatch):
+    session = _stub_session(monkeypatch)
+    to, data, params = _stub_txs(session)[1]
+    params = {**params, 'nonce': 5}
+
+    raw_tx = session._sign_tx(to, data, params)
+
+    tx = {**params, 'to': to, 'data': data}
+    assert raw_tx == Account.sign_transaction(tx, TEST_PRIVATE_KEY).rawTransaction
+
+
+def test_session_rejects_private_key_of_other_address(monkeypatch):
+    monkeypatch.setattr(pairswap, 'BatchingHTTPProvider', StubProvider)
+    address = Account.from_key('0x' + '22' * 32).address
+
+    with pytest.raises(PairswapError, match='does not belong'):
+        PairswapSession(address, TEST_PRIVATE_KEY, 'https://stub')